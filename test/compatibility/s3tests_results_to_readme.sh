@@ -57,10 +57,13 @@ import sys
 import xml.etree.ElementTree as ET
 import re
 
+UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+RANDOM_BUCKET_RE = re.compile(r's3d-test-[a-z0-9]+-[a-z0-9]+')
+
 def normalize_name(name):
     """Normalize test names by removing UUIDs and random suffixes."""
-    name = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '<UUID>', name)
-    name = re.sub(r's3d-test-[a-z0-9]+-[a-z0-9]+', 's3d-test-<RANDOM>', name)
+    name = UUID_RE.sub('<UUID>', name)
+    name = RANDOM_BUCKET_RE.sub('s3d-test-<RANDOM>', name)
     return name
 
 def normalize_message(message, max_length=100):
@@ -68,22 +71,29 @@ def normalize_message(message, max_length=100):
     if not message:
         return ''
     message = message.replace('\n', ' ').replace('|', '\\|')
-    message = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '<UUID>', message)
-    message = re.sub(r's3d-test-[a-z0-9]+-[a-z0-9]+', 's3d-test-<RANDOM>', message)
+    message = UUID_RE.sub('<UUID>', message)
+    message = RANDOM_BUCKET_RE.sub('s3d-test-<RANDOM>', message)
     if len(message) > max_length:
         return message[:max_length] + '...'
     return message
 
 results_file = sys.argv[1]
 try:
-    tree = ET.parse(results_file)
-    root = tree.getroot()
-    
     passed = []
     failed = []
     skipped = []
     
-    for testcase in root.iter('testcase'):
+    # Stream test cases and detach each one from its parent once handled,
+    # so the parsed tree does not grow with the number of test cases
+    parents = []
+    for event, elem in ET.iterparse(results_file, events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag != 'testcase':
+            continue
+        testcase = elem
         name = testcase.get('name', 'Unknown')
         normalized = normalize_name(name)
         
@@ -102,43 +112,51 @@ try:
             skipped.append((normalized, reason))
         else:
             passed.append(normalized)
+        
+        if parents:
+            parents[-1].remove(testcase)
     
-    # Print passed tests
-    print("### ✅ Passed Tests")
-    print("")
-    print("| Test Name |")
-    print("|-----------|")
+    # Collect the report and write it in one go
+    out = []
+    
+    # Passed tests
+    out.append("### ✅ Passed Tests")
+    out.append("")
+    out.append("| Test Name |")
+    out.append("|-----------|")
     if passed:
         for name in passed:
-            print(f"| `{name}` |")
+            out.append(f"| `{name}` |")
     else:
-        print("| (none) |")
+        out.append("| (none) |")
     
-    print("")
+    out.append("")
     
-    # Print failed tests
-    print("### ❌ Failed Tests")
-    print("")
-    print("| Test Name | Error Message |")
-    print("|-----------|---------------|")
+    # Failed tests
+    out.append("### ❌ Failed Tests")
+    out.append("")
+    out.append("| Test Name | Error Message |")
+    out.append("|-----------|---------------|")
     if failed:
         for name, message in failed:
-            print(f"| `{name}` | {message} |")
+            out.append(f"| `{name}` | {message} |")
     else:
-        print("| (none) | |")
+        out.append("| (none) | |")
     
-    print("")
+    out.append("")
     
-    # Print skipped tests
-    print("### ⏭️ Skipped Tests")
-    print("")
-    print("| Test Name | Reason |")
-    print("|-----------|--------|")
+    # Skipped tests
+    out.append("### ⏭️ Skipped Tests")
+    out.append("")
+    out.append("| Test Name | Reason |")
+    out.append("|-----------|--------|")
     if skipped:
         for name, reason in skipped:
-            print(f"| `{name}` | {reason} |")
+            out.append(f"| `{name}` | {reason} |")
     else:
-        print("| (none) | |")
+        out.append("| (none) | |")
+    
+    sys.stdout.buffer.write(("\n".join(out) + "\n").encode('utf-8'))
 
 except Exception as e:
     print(f"Error parsing results: {e}")